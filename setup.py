@@ -1,7 +1,48 @@
+import json
+import os
+import sys
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithValidators(build_py):
+    """
+    Build the package along with validator modules generated from the bundled schemas.
+
+    At runtime traefik_validator imports these instead of compiling the schemas.
+    """
+
+    def run(self):
+        super().run()
+
+        here = os.path.dirname(os.path.abspath(__file__))
+        sys.path.insert(0, here)
+        try:
+            from traefik_validator.codegen import generate_validator_source
+        finally:
+            sys.path.remove(here)
+
+        schemas_dir = os.path.join(here, "traefik_validator", "schemas")
+        for filename in sorted(os.listdir(schemas_dir)):
+            if not filename.endswith(".json"):
+                continue
+
+            with open(os.path.join(schemas_dir, filename), 'r') as f:
+                schema = json.load(f)
+
+            module_name = "_generated_" + filename[:-len(".json")].replace("-", "_")
+            target = os.path.join(self.build_lib, "traefik_validator", f"{module_name}.py")
+            with open(target, 'w') as f:
+                f.write(f"# Generated from schemas/{filename} by setup.py, do not edit\n")
+                f.write(generate_validator_source(schema))
+
 
 if __name__ == "__main__":
     setup(
+        cmdclass={
+            'build_py': BuildPyWithValidators,
+        },
         entry_points={
             'console_scripts': [
                 'validate_traefik=traefik_validator:validate_traefik',
@@ -2,7 +2,16 @@ import argparse
 import json
 import sys
 
-from traefik_validator.utils import Validator, ValidationError
+__version__ = "0.0.1"
+
+
+def __getattr__(name):
+    # Validator and ValidationError are imported on first access, so that
+    # --version and --help do not pay for loading the validation stack
+    if name in ("Validator", "ValidationError"):
+        from traefik_validator import utils
+        return getattr(utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def validate_traefik():
@@ -12,9 +21,11 @@ def validate_traefik():
     Parses command-line arguments and runs validation on provided config files.
     """
     parser = argparse.ArgumentParser(prog="validate_traefik", description='Validate traefik config file.')
-    parser.add_argument('-s', '--static-config', type=argparse.FileType('r'), help='The static file path')
-    parser.add_argument('-d', '--dynamic-config', type=argparse.FileType('r'), help='The dynamic file path')
-    parser.add_argument('--offline', action='store_true', help='Use cached schemas without downloading')
+    parser.add_argument('-s', '--static-config', type=argparse.FileType('rb'), help='The static file path')
+    parser.add_argument('-d', '--dynamic-config', type=argparse.FileType('rb'), help='The dynamic file path')
+    schemas_group = parser.add_mutually_exclusive_group()
+    schemas_group.add_argument('--refresh', action='store_true', help='Download the latest schemas instead of the bundled ones')
+    schemas_group.add_argument('--offline', action='store_true', help='Use previously downloaded schemas without downloading')
     parser.add_argument('--json', action='store_true', help='Output results in JSON format')
     parser.add_argument('--version', action='store_true', help='Show version information')
 
@@ -26,6 +37,8 @@ def validate_traefik():
         print(f"Supports Traefik v3.3.3")
         sys.exit(0)
 
+    from traefik_validator.utils import Validator, ValidationError
+
     try:
         # Ensure at least one config file is provided
         if not args.static_config and not args.dynamic_config:
@@ -36,7 +49,8 @@ def validate_traefik():
         validator = Validator(
             static_conf_file=args.static_config, 
             dynamic_conf_file=args.dynamic_config,
-            offline=args.offline
+            offline=args.offline,
+            refresh=args.refresh
         )
 
         print("✓ Configuration successfully validated!")
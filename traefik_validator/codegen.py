@@ -0,0 +1,20 @@
+"""
+Code generation of schema validators with fastjsonschema.
+Shared by the runtime compiler and the build step in setup.py.
+"""
+from typing import Any, Dict
+
+
+def generate_validator_source(schema: Dict[str, Any]) -> str:
+    """
+    Generate the Python source of a validator for the given schema.
+
+    The source defines a module-level "validate" function, whatever the
+    schema $id is.
+    """
+    import fastjsonschema
+    from fastjsonschema.ref_resolver import RefResolver
+
+    # The entry point is named after the schema $id, expose it as "validate"
+    entry_point = RefResolver.from_schema(schema).get_scope_name()
+    return f"{fastjsonschema.compile_to_code(schema)}\n\nvalidate = {entry_point}\n"
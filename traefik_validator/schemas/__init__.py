@@ -0,0 +1,3 @@
+"""
+Traefik JSON schemas bundled with the package.
+"""
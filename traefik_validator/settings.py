@@ -5,4 +5,14 @@ Contains configuration URLs for Traefik schemas.
 
 # Updated URLs for Traefik v3 schemas
 STATIC_CONFS_SCHEMA_URL = "https://json.schemastore.org/traefik-v3.json"
-DYNAMIC_CONFS_SCHEMA_URL = "https://json.schemastore.org/traefik-v3-file-provider.json"
\ No newline at end of file
+DYNAMIC_CONFS_SCHEMA_URL = "https://json.schemastore.org/traefik-v3-file-provider.json"
+
+# Precomputed cache keys (blake2b, 16 bytes digest) of the schema URLs above
+SCHEMA_CACHE_KEYS = {
+    STATIC_CONFS_SCHEMA_URL: "f07924b3cfffaf33542fe9fe7fbd01c9",
+    DYNAMIC_CONFS_SCHEMA_URL: "c1b03fa8027c7c8c67331cd15e9b38c2",
+}
+
+# Schemas bundled with the package, used unless fresh ones are requested
+STATIC_CONFS_SCHEMA_FILE = "traefik-v3.json"
+DYNAMIC_CONFS_SCHEMA_FILE = "traefik-v3-file-provider.json"
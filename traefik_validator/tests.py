@@ -1,12 +1,15 @@
 from unittest.mock import MagicMock, call, patch
+import io
 import os
+import subprocess
+import sys
+import urllib.error
 from pathlib import Path
 
 import pytest
-from jsonschema.exceptions import ValidationError
 
 from traefik_validator import settings
-from traefik_validator.utils import SchemaDownloader, Validator
+from traefik_validator.utils import SchemaDownloader, ValidationError, Validator
 
 
 class TestValidator:
@@ -16,6 +19,14 @@ class TestValidator:
         settings.STATIC_CONFS_SCHEMA_URL = "https://static.com"
         settings.DYNAMIC_CONFS_SCHEMA_URL = "https://dynamic.com"
 
+    @pytest.fixture(autouse=True)
+    def clear_validators(self, mocker):
+        mocker.patch.dict(SchemaDownloader._validators, clear=True)
+        mocker.patch("traefik_validator.utils._DOWNLOADER", None)
+        mocker.patch.dict(SchemaDownloader._schemas, clear=True)
+        mocker.patch.dict(SchemaDownloader._pending_writes, clear=True)
+        SchemaDownloader.get_bundled_schema.cache_clear()
+
     @pytest.fixture(autouse=True)
     def mock_schema_downloader(self, mocker):
         # Updated mock schema to match Traefik v3 structure with $defs instead of definitions
@@ -55,9 +66,12 @@ class TestValidator:
         mocker.patch("traefik_validator.utils.SchemaDownloader.download_from_url", return_value=mock_schema)
         # Mock the cache methods
         mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=False)
-        mocker.patch("traefik_validator.utils.SchemaDownloader._get_cache_path", return_value=Path("/tmp/cache.json"))
-        mocker.patch("json.dump")
-        mocker.patch("json.load", return_value=mock_schema)
+        mocker.patch(
+            "traefik_validator.utils.SchemaDownloader._get_cache_path",
+            side_effect=lambda url: Path("/tmp") / f"{url.split('//')[-1]}.json"
+        )
+        mocker.patch("orjson.dumps", return_value=b"{}")
+        mocker.patch("orjson.loads", return_value=mock_schema)
         mocker.patch("builtins.open", mocker.mock_open())
         mocker.patch("os.makedirs")
 
@@ -73,16 +87,16 @@ class TestValidator:
             Validator()
 
     def test_validator_with_both_static_and_dynamic_file_calls_download_twice(self):
-        validator = Validator(MagicMock(), MagicMock())
+        validator = Validator(MagicMock(), MagicMock(), refresh=True)
         with patch("builtins.print"):  # Suppress print output during test
             validator.validate()
         assert SchemaDownloader.download_from_url.call_count == 2
         SchemaDownloader.download_from_url.assert_has_calls(
-            [call(url="https://static.com"), call(url="https://dynamic.com")]
+            [call(url="https://static.com"), call(url="https://dynamic.com")], any_order=True
         )
 
     def test_validator_with_static_file_calls_download_one(self):
-        validator = Validator(static_conf_file=MagicMock())
+        validator = Validator(static_conf_file=MagicMock(), refresh=True)
         with patch("builtins.print"):  # Suppress print output during test
             validator.validate()
         assert SchemaDownloader.download_from_url.call_count == 1
@@ -91,7 +105,7 @@ class TestValidator:
         )
 
     def test_validator_with_dynamic_file_calls_download_one(self):
-        validator = Validator(dynamic_conf_file=MagicMock())
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
         with patch("builtins.print"):  # Suppress print output during test
             validator.validate()
         assert SchemaDownloader.download_from_url.call_count == 1
@@ -99,6 +113,110 @@ class TestValidator:
             [call(url="https://dynamic.com")]
         )
 
+    def test_validator_uses_bundled_schemas_by_default(self, mocker):
+        mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value={})
+        validator = Validator(MagicMock(), MagicMock())
+        with patch("builtins.print"):  # Suppress print output during test
+            validator.validate()
+        SchemaDownloader.download_from_url.assert_not_called()
+
+    def test_validate_reports_static_before_dynamic(self, mocker):
+        mocker.patch("traefik_validator.utils.Validator._validate_static")
+        mocker.patch(
+            "traefik_validator.utils.Validator._validate_dynamic",
+            side_effect=ValidationError("invalid", ["http"])
+        )
+        validator = Validator(MagicMock(), MagicMock())
+        with patch("builtins.print") as print_mock:
+            with pytest.raises(ValidationError):
+                validator.validate()
+        printed = [c.args[0] for c in print_mock.call_args_list]
+        assert printed == [
+            "\033[92m✓\033[0m Static configuration is valid",
+            "\033[91m✗\033[0m Dynamic configuration error: invalid",
+            "   at: http",
+        ]
+
+    def test_validate_reports_root_for_empty_error_path(self, mocker):
+        mocker.patch(
+            "traefik_validator.utils.Validator._validate_dynamic",
+            side_effect=ValidationError("data must be object")
+        )
+        validator = Validator(dynamic_conf_file=MagicMock())
+        with patch("builtins.print") as print_mock:
+            with pytest.raises(ValidationError):
+                validator.validate()
+        print_mock.assert_any_call("   at: root")
+
+    def test_validate_uses_threads_only_for_both_files_with_io(self, mocker):
+        mocker.patch("traefik_validator.utils.Validator._validate_static")
+        mocker.patch("traefik_validator.utils.Validator._validate_dynamic")
+        executor_mock = mocker.patch("traefik_validator.utils.ThreadPoolExecutor")
+        with patch("builtins.print"):  # Suppress print output during test
+            Validator(MagicMock(), MagicMock()).validate()
+            Validator(static_conf_file=MagicMock(), refresh=True).validate()
+            executor_mock.assert_not_called()
+            Validator(MagicMock(), MagicMock(), refresh=True).validate()
+        executor_mock.assert_called_once_with(max_workers=2)
+
+    def test_refresh_and_offline_cannot_be_combined(self):
+        with pytest.raises(ValueError):
+            Validator(static_conf_file=MagicMock(), offline=True, refresh=True)
+
+    def test_refresh_after_offline_downloads_schema(self, mocker):
+        mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=False)
+        mocker.patch("pathlib.Path.exists", return_value=True)
+        mocker.patch("orjson.loads", return_value={"type": "object"})
+        download_mock = mocker.patch(
+            "traefik_validator.utils.SchemaDownloader.download_from_url",
+            return_value={"type": "object", "additionalProperties": False}
+        )
+        with patch("builtins.print"):  # Suppress print output during test
+            Validator(dynamic_conf_file=MagicMock(), offline=True).validate()
+            with pytest.raises(ValidationError):
+                Validator(dynamic_conf_file=MagicMock(), refresh=True).validate()
+        download_mock.assert_called_once_with(url="https://dynamic.com")
+
+    def test_validators_share_schema_downloader(self):
+        first = Validator(static_conf_file=MagicMock())
+        second = Validator(dynamic_conf_file=MagicMock())
+        assert first.schema_downloader is second.schema_downloader
+
+    def test_validate_empty_config_skips_validator(self, mocker):
+        mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value={})
+        get_validator_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.get_validator")
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
+        with patch("builtins.print"):  # Suppress print output during test
+            validator.validate()
+        get_validator_mock.assert_not_called()
+
+    def test_validate_empty_config_with_required_keys_raise_error(self, mocker):
+        mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value={})
+        mocker.patch(
+            "traefik_validator.utils.SchemaDownloader.download_from_url",
+            return_value={"type": "object", "required": ["http"]}
+        )
+        mocker.patch("orjson.loads", return_value={"type": "object", "required": ["http"]})
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
+        with pytest.raises(ValidationError):
+            validator._validate_dynamic()
+
+    def test_validate_non_empty_config_does_not_load_schema(self, mocker):
+        get_schema_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.get_dynamic_schema")
+        validator = Validator(dynamic_conf_file=MagicMock())
+        with patch("builtins.print"):  # Suppress print output during test
+            validator.validate()
+        get_schema_mock.assert_not_called()
+
+    @pytest.mark.parametrize("schema", [
+        {"type": "array"},
+        {"anyOf": [{"required": ["a"]}]},
+        {"$ref": "#/$defs/root", "$defs": {"root": {"required": ["a"]}}},
+        {"not": {"type": "object"}},
+    ])
+    def test_empty_config_shortcut_needs_known_safe_schema(self, schema):
+        assert not Validator._accepts_empty_config(schema)
+
     def test_validate_with_invalid_data_raise_error(self, mocker):
         mock_yaml = {
             'http': {
@@ -110,11 +228,44 @@ class TestValidator:
             }
         }
         mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value=mock_yaml)
-        validator = Validator(dynamic_conf_file=MagicMock())
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
         with pytest.raises(ValidationError):
             with patch("builtins.print"):  # Suppress print output during test
                 validator.validate()
 
+    def test_validate_reports_error_path_without_root_prefix(self, mocker):
+        mock_yaml = {
+            'http': {
+                'routers': {
+                    'router_test': {
+                        'test': ''
+                    }
+                }
+            }
+        }
+        mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value=mock_yaml)
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
+        with pytest.raises(ValidationError) as excinfo:
+            validator._validate_dynamic()
+        assert excinfo.value.path == ['http', 'routers', 'router_test']
+
+    def test_validate_reports_error_path_with_dotted_keys(self, mocker):
+        mock_yaml = {
+            'http': {
+                'routers': {
+                    'api.example.com': {
+                        'test': ''
+                    }
+                }
+            }
+        }
+        mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value=mock_yaml)
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
+        with pytest.raises(ValidationError) as excinfo:
+            validator._validate_dynamic()
+        assert excinfo.value.path == ['http', 'routers', 'api.example.com']
+        assert excinfo.value.message == "must contain ['rule'] properties"
+
     def test_validate_with_valid_data_no_return(self, mocker):
         mock_yaml = {
             'http': {
@@ -126,7 +277,7 @@ class TestValidator:
             }
         }
         mocker.patch("traefik_validator.utils.Validator.load_yaml", return_value=mock_yaml)
-        validator = Validator(dynamic_conf_file=MagicMock())
+        validator = Validator(dynamic_conf_file=MagicMock(), refresh=True)
         with patch("builtins.print"):  # Suppress print output during test
             res = validator.validate()
         assert res is None
@@ -135,7 +286,8 @@ class TestValidator:
         # Set up mocks
         is_cache_valid_mock = mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=True)
         download_from_url_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.download_from_url")
-        json_load_mock = mocker.patch("json.load", return_value={})
+        json_load_mock = mocker.patch("orjson.loads", return_value={})
+        mocker.patch("pathlib.Path.exists", return_value=True)
         
         # Create validator in offline mode
         validator = Validator(dynamic_conf_file=MagicMock(), offline=True)
@@ -150,6 +302,58 @@ class TestValidator:
         download_from_url_mock.assert_not_called()
 
 
+class TestCli:
+
+    def test_version_does_not_import_validation_stack(self):
+        code = (
+            "import sys\n"
+            "from traefik_validator import validate_traefik\n"
+            "try:\n"
+            "    validate_traefik()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted({'traefik_validator.utils', 'fastjsonschema', 'yaml'} & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, "--version"], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.splitlines()[-1] == "[]"
+
+    def test_refresh_and_offline_are_mutually_exclusive(self, tmp_path):
+        config = tmp_path / "traefik.yml"
+        config.write_text("")
+        result = subprocess.run(
+            [sys.executable, "-c", "from traefik_validator import validate_traefik; validate_traefik()",
+             "-s", str(config), "--refresh", "--offline"],
+            capture_output=True, text=True
+        )
+        assert result.returncode == 2
+        assert "not allowed with argument" in result.stderr
+
+
+class TestLoadYaml:
+
+    def test_load_yaml_parses_mapping(self):
+        file = io.StringIO("http:\n  routers:\n    router_test:\n      rule: Host(`test.com`)\n")
+        assert Validator.load_yaml(file) == {
+            'http': {'routers': {'router_test': {'rule': 'Host(`test.com`)'}}}
+        }
+
+    def test_load_yaml_parses_binary_file(self):
+        file = io.BytesIO("http:\n  routers:\n    router_test:\n      rule: Host(`tést.com`)\n".encode())
+        assert Validator.load_yaml(file) == {
+            'http': {'routers': {'router_test': {'rule': 'Host(`tést.com`)'}}}
+        }
+
+    def test_load_yaml_empty_file_is_empty_mapping(self):
+        assert Validator.load_yaml(io.StringIO("")) == {}
+
+    def test_load_yaml_does_not_construct_python_objects(self):
+        import yaml
+        with pytest.raises(yaml.YAMLError):
+            Validator.load_yaml(io.StringIO("!!python/object/apply:os.system ['true']"))
+
+
 class TestSchemaDownloader:
 
     @pytest.fixture(autouse=True)
@@ -163,6 +367,12 @@ class TestSchemaDownloader:
         # Mock time for cache validation tests
         mocker.patch("time.time", return_value=1000)
 
+        # Start every test with empty in-process caches
+        mocker.patch.dict(SchemaDownloader._validators, clear=True)
+        mocker.patch.dict(SchemaDownloader._schemas, clear=True)
+        mocker.patch.dict(SchemaDownloader._pending_writes, clear=True)
+        SchemaDownloader.get_bundled_schema.cache_clear()
+
     def test_get_cache_path(self):
         downloader = SchemaDownloader()
         cache_path = downloader._get_cache_path("https://example.com/schema.json")
@@ -170,27 +380,76 @@ class TestSchemaDownloader:
         assert "schema.json" not in str(cache_path)  # Should be hashed
         assert str(cache_path).endswith(".json")
 
+    def test_cache_keys_match_schema_urls(self):
+        import hashlib
+        for url, key in settings.SCHEMA_CACHE_KEYS.items():
+            assert hashlib.blake2b(url.encode(), digest_size=16).hexdigest() == key
+
     def test_is_cache_valid_when_file_doesnt_exist(self, mocker):
         downloader = SchemaDownloader()
-        mocker.patch("pathlib.Path.exists", return_value=False)
+        mocker.patch("os.path.getmtime", side_effect=FileNotFoundError)
         assert not downloader._is_cache_valid(Path("/tmp/nonexistent"))
 
     def test_is_cache_valid_when_file_is_recent(self, mocker):
         downloader = SchemaDownloader()
-        mocker.patch("pathlib.Path.exists", return_value=True)
-        mocker.patch("pathlib.Path.stat", return_value=MagicMock(st_mtime=1000 - 3600))  # 1 hour old
+        mocker.patch("os.path.getmtime", return_value=1000 - 3600)  # 1 hour old
         assert downloader._is_cache_valid(Path("/tmp/recent"))
 
     def test_is_cache_valid_when_file_is_old(self, mocker):
         downloader = SchemaDownloader()
-        mocker.patch("pathlib.Path.exists", return_value=True)
-        mocker.patch("pathlib.Path.stat", return_value=MagicMock(st_mtime=1000 - 100000))  # Older than TTL
+        mocker.patch("os.path.getmtime", return_value=1000 - 100000)  # Older than TTL
         assert not downloader._is_cache_valid(Path("/tmp/old"))
 
+    def test_get_static_schema_returns_bundled_schema(self, mocker):
+        get_schema_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.get_schema")
+
+        schema = SchemaDownloader().get_static_schema()
+
+        get_schema_mock.assert_not_called()
+        assert schema["$id"] == "https://json.schemastore.org/traefik-v3.json"
+
+    def test_get_schema_reads_cache_once(self, mocker):
+        downloader = SchemaDownloader()
+        mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=True)
+        orjson_loads_mock = mocker.patch("orjson.loads", return_value={"test": "schema"})
+        mocker.patch("builtins.open", mocker.mock_open())
+
+        downloader.get_schema("https://example.com/schema.json")
+        SchemaDownloader().get_schema("https://example.com/schema.json")
+
+        assert orjson_loads_mock.call_count == 1
+
+    def test_get_bundled_validator_prefers_generated_module(self, mocker):
+        import fastjsonschema
+        generated = MagicMock(VERSION=fastjsonschema.VERSION)
+        mocker.patch.dict(sys.modules, {"traefik_validator._generated_traefik_v3": generated})
+        compile_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.compile_validator")
+
+        validator = SchemaDownloader().get_bundled_validator("traefik-v3.json")
+
+        compile_mock.assert_not_called()
+        assert validator is generated.validate
+
+    def test_get_bundled_validator_ignores_generated_module_from_other_version(self, mocker):
+        generated = MagicMock(VERSION="0.0.0")
+        mocker.patch.dict(sys.modules, {"traefik_validator._generated_traefik_v3": generated})
+        compile_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.compile_validator")
+
+        validator = SchemaDownloader().get_bundled_validator("traefik-v3.json")
+
+        assert validator is compile_mock.return_value
+
+    def test_get_bundled_validator_compiles_without_generated_module(self, mocker):
+        compile_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.compile_validator")
+
+        validator = SchemaDownloader().get_bundled_validator("traefik-v3.json")
+
+        assert validator is compile_mock.return_value
+
     def test_get_schema_uses_cache_when_valid(self, mocker):
         downloader = SchemaDownloader()
         mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=True)
-        json_load_mock = mocker.patch("json.load", return_value={"test": "schema"})
+        json_load_mock = mocker.patch("orjson.loads", return_value={"test": "schema"})
         open_mock = mocker.patch("builtins.open", mocker.mock_open())
         
         schema = downloader.get_schema("https://example.com/schema.json")
@@ -206,15 +465,44 @@ class TestSchemaDownloader:
             "traefik_validator.utils.SchemaDownloader.download_from_url", 
             return_value={"test": "downloaded"}
         )
-        json_dump_mock = mocker.patch("json.dump")
-        open_mock = mocker.patch("builtins.open", mocker.mock_open())
+        json_dump_mock = mocker.patch("orjson.dumps", return_value=b"{}")
         
         schema = downloader.get_schema("https://example.com/schema.json")
         
         assert download_mock.called
-        assert open_mock.called
         assert json_dump_mock.called
+        cache_path = downloader._get_cache_path("https://example.com/schema.json")
+        assert SchemaDownloader._pending_writes[cache_path] == b"{}"
         assert schema == {"test": "downloaded"}
+
+    def test_flush_cache_writes_pending_files(self, tmp_path):
+        cache_path = tmp_path / "cache" / "schema.json"
+        cache_path.parent.mkdir()
+        cache_path.write_bytes(b"old")
+        SchemaDownloader()._queue_cache_write(cache_path, b"new")
+
+        SchemaDownloader.flush_cache()
+
+        assert cache_path.read_bytes() == b"new"
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+        assert not SchemaDownloader._pending_writes
+
+    def test_flush_cache_applies_umask(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils._UMASK", 0o022)
+        cache_path = tmp_path / "schema.json"
+        SchemaDownloader()._queue_cache_write(cache_path, b"new")
+        SchemaDownloader.flush_cache()
+
+        assert cache_path.stat().st_mode & 0o777 == 0o644
+
+    def test_flush_cache_removes_temporary_file_on_failure(self, mocker, tmp_path):
+        cache_path = tmp_path / "schema.json"
+        SchemaDownloader()._queue_cache_write(cache_path, b"new")
+        mocker.patch("os.replace", side_effect=OSError)
+
+        SchemaDownloader.flush_cache()
+
+        assert list(tmp_path.iterdir()) == []
         
     def test_offline_mode_raises_error_when_no_cache(self, mocker):
         downloader = SchemaDownloader()
@@ -230,11 +518,130 @@ class TestSchemaDownloader:
         downloader = SchemaDownloader()
         mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=False)
         mocker.patch("pathlib.Path.exists", return_value=True)
-        json_load_mock = mocker.patch("json.load", return_value={"test": "expired-cache"})
+        json_load_mock = mocker.patch("orjson.loads", return_value={"test": "expired-cache"})
         open_mock = mocker.patch("builtins.open", mocker.mock_open())
         
         schema = downloader.get_schema("https://example.com/schema.json", offline=True)
         
         assert open_mock.called
         assert json_load_mock.called
-        assert schema == {"test": "expired-cache"}
\ No newline at end of file
+        assert schema == {"test": "expired-cache"}
+
+    def test_get_validator_compiles_schema_once(self, mocker):
+        get_schema_mock = mocker.patch(
+            "traefik_validator.utils.SchemaDownloader.get_schema",
+            return_value={"type": "object"}
+        )
+        mocker.patch("builtins.open", mocker.mock_open())
+
+        first = SchemaDownloader().get_validator("https://example.com/schema.json")
+        second = SchemaDownloader().get_validator("https://example.com/schema.json")
+
+        assert first is second
+        assert get_schema_mock.call_count == 1
+
+    def test_compile_validator_reuses_marshaled_code(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils.SchemaDownloader.CACHE_DIR", tmp_path)
+        downloader = SchemaDownloader()
+        schema = {"type": "object"}
+        downloader.compile_validator(schema)
+        SchemaDownloader.flush_cache()
+        assert downloader._get_code_cache_path(schema).exists()
+
+        compile_mock = mocker.patch("fastjsonschema.compile_to_code")
+        validator = downloader.compile_validator(schema)
+
+        compile_mock.assert_not_called()
+        assert validator({"key": "value"}) == {"key": "value"}
+
+    def test_code_cache_path_depends_on_schema(self):
+        downloader = SchemaDownloader()
+        assert (downloader._get_code_cache_path({"type": "object"})
+                != downloader._get_code_cache_path({"type": "string"}))
+
+    def test_compile_validator_ignores_corrupt_code_cache(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils.SchemaDownloader.CACHE_DIR", tmp_path)
+        downloader = SchemaDownloader()
+        schema = {"type": "object"}
+        downloader._get_code_cache_path(schema).write_bytes(b"not marshal data")
+
+        validator = downloader.compile_validator(schema)
+
+        assert validator({}) == {}
+
+    def test_get_schema_revalidates_expired_cache(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils.SchemaDownloader.CACHE_DIR", tmp_path)
+        downloader = SchemaDownloader()
+        url = "https://example.com/schema.json"
+        cache_path = downloader._get_cache_path(url)
+        cache_path.write_bytes(b'{"test": "cached"}')
+        downloader._get_meta_path(cache_path).write_bytes(
+            b'{"etag": "\\"abc\\"", "last_modified": "Wed, 26 Mar 2025 00:00:00 GMT"}'
+        )
+        os.utime(cache_path, (0, 0))
+        mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=False)
+        urlopen_mock = mocker.patch(
+            "urllib.request.urlopen",
+            side_effect=urllib.error.HTTPError(url, 304, "Not Modified", {}, None)
+        )
+
+        schema = downloader.get_schema(url)
+
+        request = urlopen_mock.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc"'
+        assert request.get_header("If-modified-since") == "Wed, 26 Mar 2025 00:00:00 GMT"
+        assert schema == {"test": "cached"}
+        assert cache_path.stat().st_mtime > 0
+
+    def test_get_schema_refresh_revalidates_fresh_cache(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils.SchemaDownloader.CACHE_DIR", tmp_path)
+        downloader = SchemaDownloader()
+        url = "https://example.com/schema.json"
+        downloader._get_cache_path(url).write_bytes(b'{"test": "cached"}')
+        mocker.patch("traefik_validator.utils.SchemaDownloader._is_cache_valid", return_value=True)
+        download_mock = mocker.patch(
+            "traefik_validator.utils.SchemaDownloader.download_from_url", return_value=None
+        )
+
+        assert downloader.get_schema(url) == {"test": "cached"}
+        download_mock.assert_not_called()
+        assert downloader.get_schema(url, refresh=True) == {"test": "cached"}
+        download_mock.assert_called_once_with(url=url)
+
+    def test_download_from_url_stores_cache_headers(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils.SchemaDownloader.CACHE_DIR", tmp_path)
+        downloader = SchemaDownloader()
+        url = "https://example.com/schema.json"
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.read.return_value = b'{"test": "downloaded"}'
+        response.headers = {"ETag": '"abc"'}
+        urlopen_mock = mocker.patch("urllib.request.urlopen", return_value=response)
+
+        schema = downloader.download_from_url(url)
+
+        assert urlopen_mock.call_args[0][0].headers == {}
+        assert schema == {"test": "downloaded"}
+        meta_path = downloader._get_meta_path(downloader._get_cache_path(url))
+        SchemaDownloader.flush_cache()
+        assert meta_path.read_bytes() == b'{"etag":"\\"abc\\"","last_modified":null}'
+
+    def test_offline_mode_falls_back_to_bundled_schema_without_cache(self, mocker, tmp_path):
+        mocker.patch("traefik_validator.utils.SchemaDownloader.CACHE_DIR", tmp_path)
+        get_schema_mock = mocker.patch("traefik_validator.utils.SchemaDownloader.get_schema")
+        downloader = SchemaDownloader()
+
+        schema = downloader.get_dynamic_schema(offline=True)
+        validator = downloader.get_dynamic_validator(offline=True)
+
+        get_schema_mock.assert_not_called()
+        assert schema["$id"] == "https://json.schemastore.org/traefik-v3-file-provider.json"
+        config = {"http": {"routers": {"router_test": {"rule": "Host(`test.com`)", "service": "test"}}}}
+        assert validator(config) == config
+
+    def test_empty_config_shortcut_accepts_bundled_schemas(self):
+        downloader = SchemaDownloader()
+        assert Validator._accepts_empty_config(downloader.get_bundled_schema("traefik-v3.json"))
+        assert Validator._accepts_empty_config(
+            downloader.get_bundled_schema("traefik-v3-file-provider.json")
+        )
@@ -1,98 +1,400 @@
-import json
+import atexit
+import contextlib
+import functools
+import hashlib
+import importlib
+import importlib.util
+import marshal
 import os
-import sys
+import tempfile
 import time
-import jsonschema
-import yaml
-import urllib.request
-from io import TextIOWrapper
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any, NoReturn
+from types import CodeType
+from typing import IO, Dict, List, Optional, Tuple, Union, Any, NoReturn
 
+try:
+    from importlib.resources import files
+except ImportError:  # Python < 3.9
+    from importlib_resources import files
 
 from traefik_validator import settings
+from traefik_validator.codegen import generate_validator_source
+
+# The umask can only be read by setting it, which affects every thread, so
+# it is read once at import time
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
-    pass
+
+    def __init__(self, message: str, path: Optional[List[Any]] = None):
+        super().__init__(message)
+        self.message = message
+        self.path = path or []
 
 
 class SchemaDownloader:
     """
-    A class for downloading and caching Traefik JSON schemas.
+    A class for loading, downloading and caching Traefik JSON schemas.
     
-    The schemas are cached locally to avoid repeated downloads and
-    to support offline validation. The cache has a configurable TTL.
+    By default the schemas bundled with the package are used. Fresh schemas
+    can be downloaded instead; those are cached locally to avoid repeated
+    downloads and to support offline validation. The cache has a
+    configurable TTL.
     """
     CACHE_DIR = Path.home() / ".traefik-validator" / "cache"
     CACHE_TTL = 86400  # 24 hours in seconds
+
+    # Compiled validators, keyed like _schemas for downloaded schemas and by
+    # file name for bundled ones, shared across instances
+    _validators: Dict[Any, Any] = {}
+
+    # Loaded schemas, keyed by (schema URL, offline, refresh), shared across instances
+    _schemas: Dict[Tuple[str, bool, bool], Dict[str, Any]] = {}
+
+    # Cache files waiting to be written at exit, shared across instances
+    _pending_writes: Dict[Path, bytes] = {}
+    _flush_registered = False
     
     def __init__(self):
         self.static_schema_url = settings.STATIC_CONFS_SCHEMA_URL
         self.dynamic_schema_url = settings.DYNAMIC_CONFS_SCHEMA_URL
-        os.makedirs(self.CACHE_DIR, exist_ok=True)
+        self.static_schema_file = settings.STATIC_CONFS_SCHEMA_FILE
+        self.dynamic_schema_file = settings.DYNAMIC_CONFS_SCHEMA_FILE
     
     def _get_cache_path(self, url: str) -> Path:
         """Generate a cache file path for a given URL"""
-        import hashlib
-        url_hash = hashlib.md5(url.encode()).hexdigest()
+        url_hash = settings.SCHEMA_CACHE_KEYS.get(url)
+        if url_hash is None:
+            url_hash = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
         return self.CACHE_DIR / f"{url_hash}.json"
-    
+
+    def _get_code_cache_path(self, schema: Dict[str, Any]) -> Path:
+        """
+        Generate the path of the compiled validator code for a given schema.
+
+        The path is keyed on the schema content and on every version the
+        generated code depends on, so upgrades never reuse stale code.
+        """
+        import fastjsonschema
+        from traefik_validator import __version__
+
+        key = hashlib.sha256(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS))
+        key.update(f"{__version__}:{fastjsonschema.VERSION}:".encode())
+        # The marshal format and bytecode are tied to the interpreter build
+        key.update(importlib.util.MAGIC_NUMBER)
+        return self.CACHE_DIR / f"{key.hexdigest()}.marshal"
+
+    def _queue_cache_write(self, path: Path, data: bytes) -> None:
+        """Queue a cache file to be written by flush_cache at exit"""
+        cls = type(self)
+        if not cls._flush_registered:
+            atexit.register(cls.flush_cache)
+            cls._flush_registered = True
+        cls._pending_writes[path] = data
+
+    @classmethod
+    def flush_cache(cls) -> None:
+        """
+        Write every queued cache file once.
+
+        Each file is written to a temporary file in the same directory and
+        then renamed over the target, so readers never see a partial file.
+        """
+        # NamedTemporaryFile creates files as 0600, use the umask default instead
+
+        while cls._pending_writes:
+            path, data = cls._pending_writes.popitem()
+            tmp_name = None
+            try:
+                os.makedirs(path.parent, exist_ok=True)
+                with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                    tmp_name = f.name
+                    f.write(data)
+                os.chmod(tmp_name, 0o666 & ~_UMASK)
+                os.replace(tmp_name, path)
+            except OSError:
+                # The cache is only an optimisation, validation works without it
+                if tmp_name is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_name)
+
     def _is_cache_valid(self, cache_path: Path) -> bool:
         """Check if cache file exists and is not older than TTL"""
-        if not cache_path.exists():
+        try:
+            # A single stat call both checks existence and gets the age
+            cache_age = time.time() - os.path.getmtime(cache_path)
+        except OSError:
             return False
-        
-        cache_age = time.time() - cache_path.stat().st_mtime
         return cache_age < self.CACHE_TTL
     
-    def download_from_url(self, url: str) -> Dict[str, Any]:
-        """Download schema file from given URL"""
+    def _get_meta_path(self, cache_path: Path) -> Path:
+        """Generate the path storing the HTTP cache headers of a cached schema"""
+        return cache_path.with_suffix(".meta.json")
+
+    def _get_conditional_headers(self, cache_path: Path) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached schema"""
+        if not cache_path.exists():
+            return {}
+
+        try:
+            with open(self._get_meta_path(cache_path), 'rb') as f:
+                meta = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def download_from_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Download schema file from given URL.
+
+        When a copy is already cached, the request is conditional on its
+        ETag/Last-Modified headers, and None is returned if the server
+        answers 304 Not Modified.
+        """
+        import urllib.error
+        import urllib.request
+
+        cache_path = self._get_cache_path(url)
+        request = urllib.request.Request(url, headers=self._get_conditional_headers(cache_path))
         try:
-            with urllib.request.urlopen(url) as f:
-                schema = json.loads(f.read().decode('utf-8'))
-            return schema
+            with urllib.request.urlopen(request) as f:
+                schema = orjson.loads(f.read())
+                meta = {"etag": f.headers.get("ETag"), "last_modified": f.headers.get("Last-Modified")}
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise ValueError(f"Failed to download schema from {url}: {e}")
         except urllib.error.URLError as e:
             raise ValueError(f"Failed to download schema from {url}: {e}")
+
+        self._queue_cache_write(self._get_meta_path(cache_path), orjson.dumps(meta))
+        return schema
     
-    def get_schema(self, url: str, offline: bool = False) -> Dict[str, Any]:
-        """Get schema from cache or download if needed"""
+    def get_schema(self, url: str, offline: bool = False, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get schema from cache or download if needed, once per process.
+
+        With refresh, a cached schema is always revalidated against the
+        server, which only costs a "304 Not Modified" when it is up to date.
+        """
+        key = (url, offline, refresh)
+        if key not in self._schemas:
+            self._schemas[key] = self._load_schema(url, offline, refresh)
+        return self._schemas[key]
+
+    def _load_schema(self, url: str, offline: bool = False, refresh: bool = False) -> Dict[str, Any]:
+        """Load schema from cache or download it"""
         cache_path = self._get_cache_path(url)
+
+        # Downloaded earlier in this process, not written to disk yet
+        if cache_path in self._pending_writes:
+            return orjson.loads(self._pending_writes[cache_path])
         
         # Check cache first
-        if self._is_cache_valid(cache_path):
-            with open(cache_path, 'r') as f:
-                return json.load(f)
+        if not refresh and self._is_cache_valid(cache_path):
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
                 
         # If offline mode and no valid cache, raise error
         if offline:
             if cache_path.exists():
                 # Use expired cache in offline mode
-                with open(cache_path, 'r') as f:
-                    return json.load(f)
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
             else:
                 raise ValueError(
                     f"No cached schema available for {url} and offline mode is enabled. "
-                    f"Run without --offline first to download schemas."
+                    f"Run with --refresh first to download schemas."
                 )
         
         # Download fresh schema
-        schema = self.download_from_url(url)
+        schema = self.download_from_url(url=url)
+
+        # Not modified since it was cached, only reset the cache TTL
+        if schema is None:
+            os.utime(cache_path)
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
         
         # Save to cache
-        with open(cache_path, 'w') as f:
-            json.dump(schema, f)
+        self._queue_cache_write(cache_path, orjson.dumps(schema))
         
         return schema
     
-    def get_static_schema(self, offline: bool = False) -> Dict[str, Any]:
-        """Get the static configuration schema"""
-        return self.get_schema(self.static_schema_url, offline)
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def get_bundled_schema(filename: str) -> Dict[str, Any]:
+        """Load a schema bundled with the package, once per process"""
+        return orjson.loads(files("traefik_validator.schemas").joinpath(filename).read_bytes())
+
+    def _use_downloaded_schema(self, url: str, offline: bool, refresh: bool) -> bool:
+        """
+        Check if the downloaded schema should be used instead of the bundled one.
+
+        That is when a refresh is asked for, or in offline mode when a
+        previously downloaded copy is cached.
+        """
+        if refresh:
+            return True
+        if not offline:
+            return False
+        cache_path = self._get_cache_path(url)
+        return cache_path in self._pending_writes or cache_path.exists()
+
+    def get_static_schema(self, offline: bool = False, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the static configuration schema.
+
+        The bundled schema is returned unless a refreshed (downloaded) one is
+        asked for, or in offline mode a previously downloaded one is cached.
+        """
+        if self._use_downloaded_schema(self.static_schema_url, offline, refresh):
+            return self.get_schema(self.static_schema_url, offline, refresh)
+        return self.get_bundled_schema(self.static_schema_file)
     
-    def get_dynamic_schema(self, offline: bool = False) -> Dict[str, Any]:
-        """Get the dynamic configuration schema"""
-        return self.get_schema(self.dynamic_schema_url, offline)
+    def get_dynamic_schema(self, offline: bool = False, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the dynamic configuration schema.
+
+        The bundled schema is returned unless a refreshed (downloaded) one is
+        asked for, or in offline mode a previously downloaded one is cached.
+        """
+        if self._use_downloaded_schema(self.dynamic_schema_url, offline, refresh):
+            return self.get_schema(self.dynamic_schema_url, offline, refresh)
+        return self.get_bundled_schema(self.dynamic_schema_file)
+
+    def get_validator(self, url: str, offline: bool = False, refresh: bool = False) -> Any:
+        """
+        Get a compiled validator for the schema at the given URL.
+
+        The validator is built only once and reused for every later call
+        with the same URL and mode, the same way get_schema caches schemas.
+        """
+        key = (url, offline, refresh)
+        if key not in self._validators:
+            self._validators[key] = self.compile_validator(self.get_schema(url, offline, refresh))
+        return self._validators[key]
+
+    def get_bundled_validator(self, filename: str) -> Any:
+        """
+        Get a compiled validator for a schema bundled with the package.
+
+        Wheels ship validator modules generated from the bundled schemas at
+        build time (see setup.py), which are used as is. Source checkouts
+        compile the schema instead.
+        """
+        if filename not in self._validators:
+            validator = self.get_generated_validator(filename)
+            if validator is None:
+                validator = self.compile_validator(self.get_bundled_schema(filename))
+            self._validators[filename] = validator
+        return self._validators[filename]
+
+    @staticmethod
+    def get_generated_validator(filename: str) -> Optional[Any]:
+        """
+        Import the validator generated at build time for a bundled schema, if any.
+
+        The generated code is only used with the fastjsonschema version it
+        was generated by, like the marshaled code cache.
+        """
+        import fastjsonschema
+
+        module_name = "_generated_" + Path(filename).stem.replace("-", "_")
+        try:
+            module = importlib.import_module(f"traefik_validator.{module_name}")
+        except ImportError:
+            return None
+        if getattr(module, "VERSION", None) != fastjsonschema.VERSION:
+            return None
+        return module.validate
+
+    def compile_validator(self, schema: Dict[str, Any]) -> Any:
+        """
+        Compile a schema into a validator function.
+
+        The schema is turned into Python code by fastjsonschema, and the
+        compiled code object is marshaled into the cache, so later runs with
+        the same schema skip code generation and compilation entirely.
+
+        Local "$ref" pointers are resolved once, at generation time, into
+        direct calls between generated functions, so validation never looks
+        them up. Inlining the referenced definitions instead makes
+        validation slower, because the generated code then embeds every
+        inlined definition in the errors raised while trying "oneOf" and
+        "anyOf" branches.
+        """
+        code_path = self._get_code_cache_path(schema)
+        code = self._load_code(code_path)
+
+        if code is None:
+            source = generate_validator_source(schema)
+            code = compile(source, str(code_path), "exec")
+            self._save_code(code_path, code)
+
+        namespace: Dict[str, Any] = {}
+        exec(code, namespace)
+        return namespace["validate"]
+
+    @staticmethod
+    def _load_code(code_path: Path) -> Optional[CodeType]:
+        """Load a marshaled code object, or None if missing or unreadable"""
+        try:
+            with open(code_path, 'rb') as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _save_code(self, code_path: Path, code: CodeType) -> None:
+        """Marshal a compiled code object into the cache"""
+        self._queue_cache_write(code_path, marshal.dumps(code))
+
+    def get_static_validator(self, offline: bool = False, refresh: bool = False) -> Any:
+        """Get the compiled static configuration validator"""
+        if self._use_downloaded_schema(self.static_schema_url, offline, refresh):
+            return self.get_validator(self.static_schema_url, offline, refresh)
+        return self.get_bundled_validator(self.static_schema_file)
+
+    def get_dynamic_validator(self, offline: bool = False, refresh: bool = False) -> Any:
+        """Get the compiled dynamic configuration validator"""
+        if self._use_downloaded_schema(self.dynamic_schema_url, offline, refresh):
+            return self.get_validator(self.dynamic_schema_url, offline, refresh)
+        return self.get_bundled_validator(self.dynamic_schema_file)
+
+
+_DOWNLOADER: Optional[SchemaDownloader] = None
+
+
+def get_schema_downloader() -> SchemaDownloader:
+    """
+    Get the SchemaDownloader shared by every Validator in the process.
+
+    It is created on first use, so importing the module stays cheap.
+    """
+    global _DOWNLOADER
+    if _DOWNLOADER is None:
+        _DOWNLOADER = SchemaDownloader()
+    return _DOWNLOADER
+
+
+# Root schema keywords that can never reject an empty mapping ("type" is
+# checked separately, as only "object" accepts it)
+EMPTY_CONFIG_SAFE_KEYS = frozenset({
+    "$schema", "$id", "title", "description", "definitions", "$defs",
+    "properties", "patternProperties", "additionalProperties", "type",
+})
 
 
 class Validator:
@@ -103,54 +405,74 @@ class Validator:
     - static_conf_file: for validating Traefik static configuration
     - dynamic_conf_file: for validating Traefik dynamic configuration
     
-    The validator can work in online mode (default) or offline mode.
-    In offline mode, it will use cached schemas without attempting to download.
+    By default the schemas bundled with the package are used. With refresh,
+    the latest schemas are downloaded (and cached). In offline mode, it will
+    use previously cached schemas without attempting to download, or the
+    bundled ones when nothing was downloaded yet.
     """
     def __init__(
             self,
-            static_conf_file: Optional[TextIOWrapper] = None,
-            dynamic_conf_file: Optional[TextIOWrapper] = None,
-            offline: bool = False
+            static_conf_file: Optional[IO] = None,
+            dynamic_conf_file: Optional[IO] = None,
+            offline: bool = False,
+            refresh: bool = False
     ):
         if not any([static_conf_file, dynamic_conf_file]):
             raise ValueError("User should pass either static config file or dynamic config file")
+        if offline and refresh:
+            raise ValueError("offline and refresh cannot be used together")
 
         self.static_conf_file = static_conf_file
         self.dynamic_conf_file = dynamic_conf_file
         self.offline = offline
-        self.schema_downloader = SchemaDownloader()
+        self.refresh = refresh
+        self.schema_downloader = get_schema_downloader()
 
     def validate(self) -> None:
         """
         Validate provided configuration files.
         
         This method attempts to validate both static and dynamic configuration files
-        if they were provided. It collects and reports all validation errors.
+        if they were provided, in parallel when their schemas need I/O. It collects
+        and reports all validation errors.
         
         Raises:
             ValidationError: If any configuration file fails validation
         """
         validation_errors = []
-        
-        # Validate static configuration if provided
+
+        checks = {}
         if self.static_conf_file:
+            checks["static"] = self._validate_static
+        if self.dynamic_conf_file:
+            checks["dynamic"] = self._validate_dynamic
+
+        # Static and dynamic configurations are independent. When both are
+        # given and their schemas come from the cache or the network, overlap
+        # that I/O; the bundled path is pure Python and gains nothing.
+        if len(checks) == 2 and (self.refresh or self.offline):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {kind: executor.submit(check) for kind, check in checks.items()}
+            checks = {kind: future.result for kind, future in futures.items()}
+
+        # Report results in a fixed order, whichever finished first
+        if "static" in checks:
             try:
-                self._validate_static()
+                checks["static"]()
                 print("\033[92m✓\033[0m Static configuration is valid")
-            except jsonschema.exceptions.ValidationError as e:
+            except ValidationError as e:
                 validation_errors.append(("static", e))
-                path = " → ".join(str(p) for p in e.path) if e.path else "root"
+                path = " → ".join(map(str, e.path)) or "root"
                 print(f"\033[91m✗\033[0m Static configuration error: {e.message}")
                 print(f"   at: {path}")
         
-        # Validate dynamic configuration if provided
-        if self.dynamic_conf_file:
+        if "dynamic" in checks:
             try:
-                self._validate_dynamic()
+                checks["dynamic"]()
                 print("\033[92m✓\033[0m Dynamic configuration is valid")
-            except jsonschema.exceptions.ValidationError as e:
+            except ValidationError as e:
                 validation_errors.append(("dynamic", e))
-                path = " → ".join(str(p) for p in e.path) if e.path else "root"
+                path = " → ".join(map(str, e.path)) or "root"
                 print(f"\033[91m✗\033[0m Dynamic configuration error: {e.message}")
                 print(f"   at: {path}")
         
@@ -163,38 +485,127 @@ class Validator:
         Validate static configuration file.
         
         Raises:
-            jsonschema.exceptions.ValidationError: If validation fails
+            ValidationError: If validation fails
         """
         if not self.static_conf_file:
             return
 
-        schema_file = self.schema_downloader.get_static_schema(offline=self.offline)
         config_file = self.load_yaml(self.static_conf_file)
-        jsonschema.validate(instance=config_file, schema=schema_file)
+        # Only an empty configuration needs the schema itself
+        if config_file == {} and self._accepts_empty_config(
+            self.schema_downloader.get_static_schema(offline=self.offline, refresh=self.refresh)
+        ):
+            return
+
+        validator = self.schema_downloader.get_static_validator(
+            offline=self.offline, refresh=self.refresh
+        )
+        self._run_validator(validator, config_file)
 
     def _validate_dynamic(self) -> None:
         """
         Validate dynamic configuration file.
         
         Raises:
-            jsonschema.exceptions.ValidationError: If validation fails
+            ValidationError: If validation fails
         """
         if not self.dynamic_conf_file:
             return
 
-        schema_file = self.schema_downloader.get_dynamic_schema(offline=self.offline)
         config_file = self.load_yaml(self.dynamic_conf_file)
-        jsonschema.validate(instance=config_file, schema=schema_file)
+        # Only an empty configuration needs the schema itself
+        if config_file == {} and self._accepts_empty_config(
+            self.schema_downloader.get_dynamic_schema(offline=self.offline, refresh=self.refresh)
+        ):
+            return
+
+        validator = self.schema_downloader.get_dynamic_validator(
+            offline=self.offline, refresh=self.refresh
+        )
+        self._run_validator(validator, config_file)
+
+    @staticmethod
+    def _accepts_empty_config(schema: Dict[str, Any]) -> bool:
+        """
+        Check if an empty configuration is trivially valid for the schema.
+
+        Only schemas whose root keys all belong to EMPTY_CONFIG_SAFE_KEYS (and
+        whose root type, if any, is "object") are known to accept an empty
+        mapping. This skips building and running the validator.
+        """
+        if not set(schema) <= EMPTY_CONFIG_SAFE_KEYS:
+            return False
+        return schema.get("type", "object") == "object"
 
     @staticmethod
-    def load_yaml(file: TextIOWrapper) -> Dict[str, Any]:
+    def _run_validator(validator: Any, config: Any) -> None:
+        """
+        Run a compiled validator against a loaded configuration.
+        
+        Raises:
+            ValidationError: If validation fails
+        """
+        from fastjsonschema import JsonSchemaValueException
+
+        try:
+            validator(config)
+        except JsonSchemaValueException as e:
+            # fastjsonschema prefixes every name with the root name "data"
+            message = e.message
+            if message.startswith(e.name + " "):
+                message = message[len(e.name) + 1:]
+            path = Validator._resolve_error_path(config, e.name[len("data"):])
+            raise ValidationError(message, e.path[1:] if path is None else path) from e
+
+    @staticmethod
+    def _resolve_error_path(node: Any, name: str) -> Optional[List[Any]]:
+        """
+        Split a fastjsonschema error name into keys of the configuration.
+
+        fastjsonschema joins keys with dots, so keys containing dots (like
+        router names such as "api.example.com") cannot be told apart by
+        splitting. The name is matched against the keys actually present in
+        the configuration instead.
+
+        Returns:
+            The list of keys and indexes, None if the name does not match
+        """
+        if not name:
+            return []
+        if name.startswith("[") and isinstance(node, list):
+            index, _, rest = name[1:].partition("]")
+            if index.isdigit() and int(index) < len(node):
+                path = Validator._resolve_error_path(node[int(index)], rest)
+                if path is not None:
+                    return [int(index)] + path
+        elif name.startswith(".") and isinstance(node, dict):
+            # Try longer keys first so "a.b" wins over "a" followed by "b"
+            for key in sorted(node, key=lambda k: len(str(k)), reverse=True):
+                if name.startswith(str(key), 1):
+                    path = Validator._resolve_error_path(node[key], name[len(str(key)) + 1:])
+                    if path is not None:
+                        return [key] + path
+        return None
+
+    @staticmethod
+    def load_yaml(file: IO) -> Dict[str, Any]:
         """
         Load and parse YAML file safely.
+
+        Uses the libyaml based loader when PyYAML was built with it. Files
+        opened in binary mode are decoded by the parser itself.
         
         Args:
-            file: A file-like object containing YAML content
+            file: A file-like object containing YAML content, binary or text
             
         Returns:
-            Parsed YAML content as a dictionary
+            Parsed YAML content as a dictionary, empty for an empty file
         """
-        return yaml.safe_load(file)
\ No newline at end of file
+        import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader
+
+        config = yaml.load(file, Loader=SafeLoader)
+        return {} if config is None else config
\ No newline at end of file